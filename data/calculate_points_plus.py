@@ -4,6 +4,8 @@ import os
 import pandas as pd
 import numpy as np
 
+from validate_data import reconcile, write_report, print_summary
+
 RAW_DIR = os.path.join(os.path.dirname(__file__), "raw")
 
 MIN_GAMES = 10
@@ -136,6 +138,11 @@ def main():
     print("Loading raw data...")
     teams, rosters, game_logs, schedules = load_data()
 
+    print("Validating raw data...")
+    game_logs, schedules, report = reconcile(game_logs, schedules, rosters)
+    print_summary(report)
+    write_report(report)
+
     print("Calculating Points+...")
     qualifying, game_logs_dict, league_avg = calculate(
         teams, rosters, game_logs, schedules
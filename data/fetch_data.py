@@ -149,11 +149,9 @@ def fetch_game_logs(rosters_df):
                 skipped += 1
                 continue
 
-            # Get regular season stats
+            # Tag each event with its season type; filtering happens in validate_data
             for st in season_types:
-                if "Regular" not in st.get("displayName", ""):
-                    # Only first category tends to be regular season anyway
-                    pass
+                season_type = st.get("displayName", "")
                 for cat in st.get("categories", []):
                     for evt in cat.get("events", []):
                         event_id = evt["eventId"]
@@ -194,6 +192,7 @@ def fetch_game_logs(rosters_df):
                             "min": minutes,
                             "pts": points,
                             "score": event_info.get("score", ""),
+                            "season_type": season_type,
                         })
 
         except Exception as e:
@@ -265,6 +264,7 @@ def fetch_team_schedules(teams_df):
                         "team_score": team_score,
                         "opp_score": opp_score,
                         "result": "W" if team_score > opp_score else "L",
+                        "season_type": event.get("seasonType", {}).get("name", ""),
                     })
 
         except Exception as e:
@@ -0,0 +1,218 @@
+"""Validate and reconcile raw game logs against team schedules before calculating Points+."""
+
+import os
+import json
+import pandas as pd
+from datetime import datetime
+
+RAW_DIR = os.path.join(os.path.dirname(__file__), "raw")
+REPORT_PATH = os.path.join(RAW_DIR, "data_quality.json")
+
+# Season types kept for the Points+ calculation. "unknown" means no label at
+# all (older CSVs fetched before season types were recorded); labels that are
+# present but unrecognized are tagged "other" and dropped.
+KEEP_SEASON_TYPES = ("regular", "unknown")
+
+# Cap on individual unmatched rows listed in the report; the counts cover the rest
+MAX_REPORTED_ROWS = 50
+
+
+def normalize_season_type(values):
+    """Map ESPN season type labels ("2025-26 Regular Season", "Postseason", ...) to short tags."""
+    labels = values.fillna("").astype(str).str.strip().str.lower()
+    tags = pd.Series("other", index=values.index)
+    tags[labels == ""] = "unknown"
+    tags[labels.str.contains(r"\bregular")] = "regular"
+    tags[labels.str.contains(r"\bpost")] = "postseason"
+    tags[labels.str.contains(r"\bpre")] = "preseason"
+    return tags
+
+
+def _as_int_ids(df, columns):
+    """Cast ID columns to int64, dropping rows where any of them can't be parsed.
+
+    Returns the cast frame and the number of rows dropped.
+    """
+    ids = df[columns].apply(pd.to_numeric, errors="coerce")
+    valid = ids.notna().all(axis=1)
+    df = df[valid].copy()
+    df[columns] = ids[valid].astype("int64")
+    return df, int((~valid).sum())
+
+
+def _unmatched_rows(logs, mask):
+    rows = logs.loc[mask, ["player_id", "game_id", "team_id", "opponent_id"]].head(MAX_REPORTED_ROWS)
+    return [
+        {
+            "playerId": int(r["player_id"]),
+            "gameId": int(r["game_id"]),
+            "teamId": int(r["team_id"]),
+            "opponentId": int(r["opponent_id"]),
+        }
+        for r in rows.to_dict("records")
+    ]
+
+
+def _label_counts(labels, tags):
+    """Count the raw season type labels that were tagged "unknown" or "other"."""
+    unrecognized = labels[tags.isin(("unknown", "other"))]
+    return {str(k): int(v) for k, v in unrecognized.value_counts().items()}
+
+
+def reconcile(game_logs, schedules, rosters):
+    """Dedupe game logs, tag season type, and flag rows with no matching schedule game.
+
+    Everything is done with a handful of merges on (player_id, game_id) and
+    (team_id, game_id), so cost grows linearly with the number of rows.
+    Returns the cleaned game logs, the deduped regular-season schedules, and a
+    data-quality report dict.
+    """
+    raw_log_rows = len(game_logs)
+    raw_sched_rows = len(schedules)
+    logs, log_bad_ids = _as_int_ids(game_logs, ["player_id", "game_id", "opponent_id"])
+    sched, sched_bad_ids = _as_int_ids(schedules, ["team_id", "game_id", "opponent_id"])
+
+    if "season_type" not in logs.columns:
+        logs["season_type"] = ""
+    if "season_type" not in sched.columns:
+        sched["season_type"] = ""
+    logs["season_label"] = logs["season_type"].fillna("").astype(str)
+    sched["season_label"] = sched["season_type"].fillna("").astype(str)
+
+    # Dedupe on the natural keys
+    logs = logs.drop_duplicates(subset=["player_id", "game_id"], keep="first")
+    sched = sched.drop_duplicates(subset=["team_id", "game_id"], keep="first")
+    deduped_log_rows = len(logs)
+    deduped_sched_rows = len(sched)
+
+    # Opponent metrics only use the same season types as the game logs. The
+    # full tagged schedule is kept for the season type lookup so postseason
+    # games are still recognized (and dropped) on the game log side.
+    sched["season_type"] = normalize_season_type(sched["season_type"])
+    sched_keep = sched["season_type"].isin(KEEP_SEASON_TYPES)
+    tagged_sched = sched
+    sched = sched[sched_keep]
+
+    # Attach each player's team from the roster; 0 marks players not on a roster
+    roster_teams, _ = _as_int_ids(rosters, ["player_id", "team_id"])
+    roster_teams = roster_teams[["player_id", "team_id"]].drop_duplicates(subset=["player_id"])
+    logs = logs.merge(roster_teams, on="player_id", how="left")
+    no_roster_team = logs["team_id"].isna()
+    logs["team_id"] = logs["team_id"].fillna(0).astype("int64")
+
+    # Player's team side of the game; rows kept below only match kept schedule games
+    team_side = tagged_sched[["team_id", "game_id", "season_type", "season_label"]].rename(
+        columns={"season_type": "sched_season_type", "season_label": "sched_season_label"}
+    )
+    team_side["team_game_found"] = True
+    logs = logs.merge(team_side, on=["team_id", "game_id"], how="left")
+
+    # Opponent's side of the same game — missing here means league-average defense and pace
+    opp_side = sched[["team_id", "game_id"]].rename(columns={"team_id": "opponent_id"})
+    opp_side["opp_game_found"] = True
+    logs = logs.merge(opp_side, on=["opponent_id", "game_id"], how="left")
+
+    logs["team_game_found"] = logs["team_game_found"].notna()
+    logs["opp_game_found"] = logs["opp_game_found"].notna()
+    logs["opp_has_schedule"] = logs["opponent_id"].isin(sched["team_id"].unique())
+
+    # Schedule season type is authoritative; fall back to the game log's own tag
+    sched_tag = logs["sched_season_type"].fillna("unknown")
+    log_tag = normalize_season_type(logs["season_type"])
+    use_sched = sched_tag != "unknown"
+    logs["season_type"] = sched_tag.where(use_sched, log_tag)
+    logs["season_label"] = logs["sched_season_label"].where(use_sched, logs["season_label"])
+    log_labels = _label_counts(logs["season_label"], logs["season_type"])
+    sched_labels = _label_counts(tagged_sched["season_label"], tagged_sched["season_type"])
+    logs = logs.drop(columns=["sched_season_type", "sched_season_label", "season_label"])
+    sched = sched.drop(columns=["season_label"])
+
+    keep = logs["season_type"].isin(KEEP_SEASON_TYPES)
+    clean = logs[keep].reset_index(drop=True)
+    no_roster_team = no_roster_team[keep.values]
+
+    missing_opps = clean[~clean["opp_has_schedule"]]
+    missing_opps = (
+        missing_opps.groupby(["opponent_id", "opponent_abbr"], dropna=False)
+        .size()
+        .sort_values(ascending=False)
+        .reset_index(name="rows")
+    )
+
+    report = {
+        "generatedAt": datetime.now().isoformat(),
+        "gameLogs": {
+            "rawRows": raw_log_rows,
+            "invalidIdsDropped": log_bad_ids,
+            "duplicatesDropped": raw_log_rows - log_bad_ids - deduped_log_rows,
+            "seasonTypes": {k: int(v) for k, v in logs["season_type"].value_counts().items()},
+            "unrecognizedLabels": log_labels,
+            "droppedNonRegular": int((~keep).sum()),
+            "keptRows": len(clean),
+            "noRosterTeam": int(no_roster_team.sum()),
+            "noTeamScheduleGame": int((~clean["team_game_found"]).sum()),
+            "noOpponentScheduleGame": int((~clean["opp_game_found"]).sum()),
+            "opponentWithoutSchedule": int((~clean["opp_has_schedule"]).sum()),
+        },
+        "schedules": {
+            "rawRows": raw_sched_rows,
+            "invalidIdsDropped": sched_bad_ids,
+            "duplicatesDropped": raw_sched_rows - sched_bad_ids - deduped_sched_rows,
+            "seasonTypes": {k: int(v) for k, v in tagged_sched["season_type"].value_counts().items()},
+            "unrecognizedLabels": sched_labels,
+            "droppedNonRegular": int((~sched_keep).sum()),
+            "keptRows": len(sched),
+        },
+        "noTeamScheduleGameRows": _unmatched_rows(clean, ~clean["team_game_found"]),
+        "noOpponentScheduleGameRows": _unmatched_rows(clean, ~clean["opp_game_found"]),
+        "opponentsWithoutSchedule": [
+            {
+                "opponentId": int(r["opponent_id"]),
+                "opponentAbbr": None if pd.isna(r["opponent_abbr"]) else str(r["opponent_abbr"]),
+                "rows": int(r["rows"]),
+            }
+            for r in missing_opps.to_dict("records")
+        ],
+    }
+
+    return clean, sched.reset_index(drop=True), report
+
+
+def write_report(report, path=REPORT_PATH):
+    """Write the data-quality report as JSON."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"  Saved {os.path.basename(path)}")
+
+
+def print_summary(report):
+    """Print the headline data-quality counts."""
+    gl = report["gameLogs"]
+    sc = report["schedules"]
+    print(f"  Game logs: {gl['rawRows']} raw, {gl['invalidIdsDropped']} bad IDs, {gl['duplicatesDropped']} duplicates, "
+          f"{gl['droppedNonRegular']} non-regular-season dropped, {gl['keptRows']} kept")
+    print(f"  Rows with no matching team schedule game: {gl['noTeamScheduleGame']}")
+    print(f"  Rows with no matching opponent schedule game: {gl['noOpponentScheduleGame']}")
+    print(f"  Rows vs. opponents without schedule data: {gl['opponentWithoutSchedule']} "
+          f"({len(report['opponentsWithoutSchedule'])} opponents)")
+    print(f"  Schedules: {sc['rawRows']} raw, {sc['invalidIdsDropped']} bad IDs, {sc['duplicatesDropped']} duplicates, "
+          f"{sc['droppedNonRegular']} non-regular-season dropped, {sc['keptRows']} kept")
+    for name, section in (("game logs", gl), ("schedules", sc)):
+        if section["unrecognizedLabels"]:
+            print(f"  Unlabeled/unrecognized season types in {name}: {section['unrecognizedLabels']}")
+
+
+def main():
+    from calculate_points_plus import load_data
+
+    print("Validating raw data...")
+    _, rosters, game_logs, schedules = load_data()
+    clean, sched, report = reconcile(game_logs, schedules, rosters)
+    print_summary(report)
+    write_report(report)
+    return clean, sched, report
+
+
+if __name__ == "__main__":
+    main()